@@ -1,9 +1,22 @@
+import os
+import shutil
 from pathlib import Path
 
 import nox
 
 nox.options.default_venv_backend = "uv|virtualenv"
 
+# Share one uv download cache across sessions. Copy packages out of it, since
+# the cache and .nox/ may be on different filesystems (no hardlinks).
+os.environ.setdefault("UV_CACHE_DIR", str(Path.home() / ".cache" / "uv-myst"))
+os.environ.setdefault("UV_LINK_MODE", "copy")
+
+
+def _install_myst(session):
+    """Install mystmd into the session venv, unless it is already there."""
+    if shutil.which("myst", path=session.bin) is None:
+        session.install("mystmd")
+
 
 @nox.session(python=False)
 def build(session):
@@ -16,30 +29,30 @@ def build(session):
             session.run("npm", "run", "build", external=True)
 
 
-@nox.session
+@nox.session(reuse_venv=True)
 def docs(session):
     """Build the documentation as static HTML using MyST."""
     build(session)
-    session.install("mystmd")
+    _install_myst(session)
     session.run("myst", "build", "--html")
 
 
-@nox.session(name="docs-live")
+@nox.session(name="docs-live", reuse_venv=True)
 def docs_live(session):
     """Start a live development server for the documentation."""
     build(session)
-    session.install("mystmd")
+    _install_myst(session)
     session.run("myst", "start")
 
 
-@nox.session(name="clean")
+@nox.session(name="clean", reuse_venv=True)
 def clean(session):
     """Clean the documentation build artifacts."""
-    session.install("mystmd")
+    _install_myst(session)
     session.run("myst", "clean", "--all")
 
 
-@nox.session
+@nox.session(reuse_venv=True)
 def release(session):
     """Create GitHub releases for plugins.
 
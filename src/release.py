@@ -24,17 +24,20 @@ Expected Behavior:
        - From dist/ directory if plugin was built
        - From plugin directory (.mjs files) if no build
     5. Extracts description from plugin README.md (first paragraph)
-    6. Generates gh release command with:
+    6. Prepares a GitHub release with:
        - Tag name: plugin directory name
        - Title: Formatted plugin name
        - Assets: Collected .mjs files
-    7. Executes release if --deploy flag is present, otherwise shows command
+    7. Creates the release if --deploy flag is present, otherwise shows what
+       would be released. Releases are created through the GitHub REST API,
+       authenticated with GH_TOKEN or GITHUB_TOKEN (falling back to
+       `gh auth token`).
 
 Examples:
     # List all plugins with release status
     python src/release.py
 
-    # Dry-run release for specific plugin (shows command without executing)
+    # Dry-run release for specific plugin (shows the release without creating it)
     python src/release.py github-issue-table
 
     # Actually create release for specific plugin
@@ -44,11 +47,54 @@ Examples:
     python src/release.py --all --deploy
 """
 
+import contextlib
 import datetime
+import functools
+import hashlib
+import http.client
+import json
+import mimetypes
+import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Serializes output when plugins are processed in parallel
+_log_lock = threading.Lock()
+
+# Per-thread buffer of log lines, see log_block()
+_log_local = threading.local()
+
+# Build outputs (dist/) are cached here, keyed by a digest of plugin sources
+BUILD_CACHE_DIR = Path.home() / ".cache" / "myst-plugins-build"
+
+# Directories bundled into several plugins' builds, part of every digest
+SHARED_SOURCE_DIRS = ("github-shared",)
+
+# Upstream repository, released to if the checkout's repository is unknown
+GITHUB_REPO = "jupyter-book/myst-plugins"
+
+# Seconds to wait on a stalled GitHub connection before giving up
+GITHUB_TIMEOUT = 60
+
+# Requests that are safe to resend if a kept-alive connection was dropped
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE")
+
+# Kept-alive GitHub connections, keyed by (thread id, host). They are closed
+# after each plugin's release, so no request is sent on a connection that sat
+# idle (and may have been dropped by the server) during the next build.
+_github_connections = {}
+_github_lock = threading.Lock()
+
+# Maximum number of assets of one release uploaded at the same time
+UPLOAD_WORKERS = 8
+
 
 def log(message, level="info"):
     """Log a message with optional level."""
@@ -57,115 +103,237 @@ def log(message, level="info"):
         "error": "❌",
         "warning": "⚠️",
     }.get(level, "")
-    print(f"{prefix} {message}" if prefix else message)
+    line = f"{prefix} {message}" if prefix else message
+    buffer = getattr(_log_local, "buffer", None)
+    if buffer is not None:
+        buffer.append(line)
+        return
+    with _log_lock:
+        print(line)
+
+
+@contextlib.contextmanager
+def log_block():
+    """Collect this thread's log lines and print them together at the end.
+
+    Used when plugins are processed in parallel, so that each plugin's output
+    stays in one block under its name.
+    """
+    _log_local.buffer = []
+    try:
+        yield
+    finally:
+        lines, _log_local.buffer = _log_local.buffer, None
+        with _log_lock:
+            print("\n".join(lines))
+
+
+@functools.cache
+def latest_release_tags():
+    """Find the latest release tag of every plugin with a single git call.
+
+    Returns a dict mapping plugin name to a ``(tag, date, commit)`` tuple for
+    the newest ``plugin-name@*`` tag, or None if git fails. The result is
+    cached, so git is only queried once per run.
+    """
+    result = subprocess.run(
+        ["git", "for-each-ref", "--sort=-version:refname",
+         "--format=%(refname:lstrip=2)\t%(creatordate:short)"
+         "\t%(*objectname)\t%(objectname)",
+         "refs/tags/"],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
 
+    tags = {}
+    for line in result.stdout.splitlines():
+        tag, date, peeled, obj = line.split("\t")
+        name, sep, _ = tag.partition("@")
+        if sep:
+            # Annotated tags are peeled so that tags on one commit compare equal
+            tags.setdefault(name, (tag, date, peeled or obj))
+    return tags
 
-def list_plugins(plugins_dir):
-    """List all available plugins with their release status."""
-    all_plugin_dirs = sorted([p for p in plugins_dir.iterdir() if p.is_dir()])
+
+def list_plugins(plugin_dirs):
+    """List the given plugin directories with their release status."""
+    tags = latest_release_tags()
 
     log("Available plugins:")
-    for plugin_dir in all_plugin_dirs:
+    for plugin_dir in plugin_dirs:
         plugin_name = plugin_dir.name
 
-        # Check for existing release (pattern: plugin-name@*)
-        try:
-            result = subprocess.run(
-                ["git", "tag", "-l", f"{plugin_name}@*", "--sort=-version:refname"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            tags = result.stdout.strip().split('\n')
-            latest_tag = tags[0] if tags and tags[0] else None
-
-            if latest_tag:
-                # Get release date from tag
-                date_result = subprocess.run(
-                    ["git", "log", "-1", "--format=%ai", latest_tag],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                if date_result.stdout.strip():
-                    release_date = date_result.stdout.strip().split()[0]
-                    print(
-                        f"  - {plugin_name:<30} "
-                        f"(last released: {release_date})"
-                    )
-                else:
-                    print(f"  - {plugin_name:<30} (released)")
-            else:
-                print(f"  - {plugin_name:<30} (never released)")
-        except subprocess.CalledProcessError:
+        if tags is None:
             print(f"  - {plugin_name:<30} (status unknown)")
+        elif plugin_name not in tags:
+            print(f"  - {plugin_name:<30} (never released)")
+        elif tags[plugin_name][1]:
+            print(
+                f"  - {plugin_name:<30} "
+                f"(last released: {tags[plugin_name][1]})"
+            )
+        else:
+            print(f"  - {plugin_name:<30} (released)")
 
     print("\nUsage: python -m src.release <plugin-name> [--deploy]")
     print("       python -m src.release --all [--deploy]")
 
 
-def check_changes_since_release(plugin_name, plugin_dir):
-    """Check if plugin has changes since last release."""
-    try:
-        # Find most recent tag for this plugin (pattern: plugin-name@*)
+def load_change_map(plugin_names, plugins_dir):
+    """Check which plugins have changes since their last release.
+
+    Returns a dict mapping plugin name to a ``(has_changes, message)`` tuple.
+    Plugins whose latest tags point at the same commit (e.g. released together
+    with ``--all``) are checked with a single ``git diff``.
+    """
+    tags = latest_release_tags()
+    if tags is None:
+        log("Could not check git history: git for-each-ref failed", "warning")
+        return {
+            name: (True, "Could not check git history")
+            for name in plugin_names
+        }
+
+    changes = {}
+    plugins_by_commit = {}
+    for plugin_name in plugin_names:
+        if plugin_name in tags:
+            commit = tags[plugin_name][2]
+            plugins_by_commit.setdefault(commit, []).append(plugin_name)
+        else:
+            changes[plugin_name] = (True, "No previous release found")
+
+    for commit, names in plugins_by_commit.items():
         result = subprocess.run(
-            ["git", "tag", "-l", f"{plugin_name}@*", "--sort=-version:refname"],
+            ["git", "diff", "--name-only", "--no-renames", "-z", "--relative",
+             commit, "HEAD", "--"] + [str(plugins_dir / name) for name in names],
             capture_output=True,
             text=True,
-            check=True
+            check=False
         )
+        if result.returncode != 0:
+            log(f"Could not check git history: {result.stderr.strip()}", "warning")
+            for plugin_name in names:
+                changes[plugin_name] = (True, "Could not check git history")
+            continue
+
+        # Without rename detection a moved file shows up under both plugins,
+        # and -z keeps git from quoting unusual (e.g. non-ASCII) paths
+        changed = {
+            Path(path).relative_to(plugins_dir).parts[0]
+            for path in result.stdout.split("\0") if path
+        }
+        for plugin_name in names:
+            if plugin_name in changed:
+                changes[plugin_name] = (True, "Changes detected since last release")
+            else:
+                changes[plugin_name] = (False, "No changes since last release")
 
-        tags = result.stdout.strip().split('\n')
-        latest_tag = tags[0] if tags and tags[0] else None
-
-        if latest_tag:
-            # Tag exists, check for changes since tag
-            diff_result = subprocess.run(
-                ["git", "diff", "--quiet", latest_tag,
-                 "HEAD", "--", str(plugin_dir)],
-                capture_output=True
-            )
+    return changes
 
-            if diff_result.returncode == 0:
-                return False, "No changes since last release"
-            else:
-                return True, "Changes detected since last release"
-        else:
-            return True, "No previous release found"
 
-    except subprocess.CalledProcessError as e:
-        log(f"Could not check git history: {e}", "warning")
-        return True, "Could not check git history"
+def sources_digest(plugin_dir):
+    """Hash the build inputs of a plugin (everything but node_modules/ and dist/)."""
+    digest = hashlib.blake2b(plugin_dir.name.encode())
+    source_dirs = [plugin_dir] + [
+        plugin_dir.parent / name for name in SHARED_SOURCE_DIRS
+    ]
+    for source_dir in source_dirs:
+        for root, dirs, files in os.walk(source_dir):
+            dirs[:] = sorted(d for d in dirs if d not in ("node_modules", "dist"))
+            for file_name in sorted(files):
+                path = Path(root) / file_name
+                digest.update(str(path.relative_to(plugin_dir.parent)).encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_build(dist_dir, cache_dir):
+    """Store a copy of ``dist_dir`` as ``cache_dir``.
+
+    The copy is made in a temporary sibling and moved into place, so an
+    interrupted or failed copy never leaves a partial cache entry behind.
+    """
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f".{cache_dir.name}.", dir=cache_dir.parent))
+    try:
+        shutil.copytree(dist_dir, tmp_dir, dirs_exist_ok=True)
+        os.replace(tmp_dir, cache_dir)
+    except OSError as e:
+        # A concurrent run may have stored the same entry first
+        if not cache_dir.is_dir():
+            log(f"Could not cache build: {e}", "warning")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
 def build_plugin(plugin_dir, build_file):
-    """Build a plugin using its build file."""
-    log(f"  Building plugin with {build_file.name}...")
+    """Build a plugin using its build file.
+
+    Build outputs are cached in ``BUILD_CACHE_DIR``, so a plugin whose sources
+    have not changed is restored from the cache instead of being rebuilt.
+    """
+    dist_dir = plugin_dir / "dist"
+    cache_dir = BUILD_CACHE_DIR / sources_digest(plugin_dir)
+    if cache_dir.is_dir():
+        shutil.rmtree(dist_dir, ignore_errors=True)
+        shutil.copytree(cache_dir, dist_dir)
+        log("  Sources unchanged, restored build from cache")
+        return True
 
-    try:
-        # Check if node_modules exists, if not run npm install
-        if not (plugin_dir / "node_modules").exists():
-            subprocess.run(
-                ["npm", "install"],
-                cwd=plugin_dir,
-                check=True,
-                capture_output=True
-            )
+    log(f"  Building plugin with {build_file.name}...")
 
-        # Run the build
-        subprocess.run(
-            ["node", build_file.name],
+    lockfile = plugin_dir / "package-lock.json"
+    lock_hash = None
+    install_cmd = None
+    if lockfile.exists() and (plugin_dir / "package.json").exists():
+        # Install from the lockfile, skipping it if the lockfile is
+        # unchanged since the last install
+        lock_hash = hashlib.sha256(lockfile.read_bytes()).hexdigest()
+        hash_file = plugin_dir / "node_modules" / ".install-hash"
+        if not hash_file.exists() or hash_file.read_text() != lock_hash:
+            install_cmd = ["npm", "ci", "--prefer-offline", "--no-audit"]
+    elif not (plugin_dir / "node_modules").exists():
+        # No lockfile to install from, run npm install if needed
+        install_cmd = ["npm", "install"]
+
+    if install_cmd:
+        # Only the exit code is used, so don't pipe the output
+        result = subprocess.run(
+            install_cmd,
             cwd=plugin_dir,
-            check=True,
-            capture_output=True
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
-        log("  Build successful")
-        return True
-
-    except subprocess.CalledProcessError as e:
-        log(f"Build failed: {e}", "error")
+        if result.returncode != 0:
+            log(f"Build failed: {' '.join(install_cmd)} exited with "
+                f"status {result.returncode}", "error")
+            return False
+        if lock_hash:
+            hash_file.parent.mkdir(exist_ok=True)
+            hash_file.write_text(lock_hash)
+
+    # Run the build
+    result = subprocess.run(
+        ["node", build_file.name],
+        cwd=plugin_dir,
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    if result.returncode != 0:
+        log(f"Build failed: node {build_file.name} exited with "
+            f"status {result.returncode}", "error")
         return False
+    log("  Build successful")
+
+    if dist_dir.is_dir():
+        cache_build(dist_dir, cache_dir)
+    return True
 
 
 def collect_release_assets(plugin_dir, built=False):
@@ -196,76 +364,269 @@ def collect_release_assets(plugin_dir, built=False):
         return assets
 
 
+@functools.cache
+def github_token():
+    """Get a GitHub token from the environment, falling back to the gh CLI."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if not token:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode == 0:
+            token = result.stdout.strip()
+    return token
+
+
+@functools.cache
+def github_repo():
+    """Get the ``owner/repo`` to release to, like ``gh release create`` does.
+
+    Uses ``GITHUB_REPOSITORY`` (set in GitHub Actions), then the gh CLI, then
+    the ``origin`` remote, and finally falls back to ``GITHUB_REPO``.
+    """
+    repo = os.environ.get("GITHUB_REPOSITORY")
+    if repo:
+        return repo
+
+    if shutil.which("gh"):
+        result = subprocess.run(
+            ["gh", "repo", "view", "--json", "nameWithOwner",
+             "--jq", ".nameWithOwner"],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+
+    result = subprocess.run(
+        ["git", "remote", "get-url", "origin"],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    match = re.search(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$",
+                      result.stdout.strip())
+    if result.returncode == 0 and match:
+        return match.group(1)
+
+    return GITHUB_REPO
+
+
+def github_api():
+    """Get the GitHub API URL of the repository to release to."""
+    return f"https://api.github.com/repos/{github_repo()}"
+
+
+def github_request(method, url, body=None, content_type="application/json"):
+    """Send a request to the GitHub API and return ``(status, data)``.
+
+    Connections are kept alive and reused by later requests from the same
+    thread, until ``close_github_connections`` is called. ``body`` may be a
+    dict (sent as JSON) or bytes. ``data`` is the decoded JSON response, or
+    None if it was empty. Network errors give a status of None, with the
+    error in ``data["message"]``.
+    """
+    parts = urllib.parse.urlsplit(url)
+    key = (threading.get_ident(), parts.netloc)
+    with _github_lock:
+        if key not in _github_connections:
+            _github_connections[key] = http.client.HTTPSConnection(
+                parts.netloc, timeout=GITHUB_TIMEOUT
+            )
+        connection = _github_connections[key]
+
+    if isinstance(body, dict):
+        body = json.dumps(body).encode()
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "Authorization": f"Bearer {github_token()}",
+        "User-Agent": "myst-plugins-release",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    if body is not None:
+        headers["Content-Type"] = content_type
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    try:
+        try:
+            connection.request(method, path, body=body, headers=headers)
+        except (ConnectionResetError, BrokenPipeError):
+            # The server closed the connection before taking the request, so
+            # it is safe to resend any method on a fresh connection
+            connection.close()
+            connection.request(method, path, body=body, headers=headers)
+        try:
+            response = connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError):
+            # The request may have been handled, only resend idempotent ones
+            connection.close()
+            if method not in IDEMPOTENT_METHODS:
+                raise
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+        data = response.read()
+    except (http.client.HTTPException, OSError) as e:
+        connection.close()
+        return None, {"message": f"{type(e).__name__}: {e}"}
+
+    try:
+        return response.status, json.loads(data) if data else None
+    except json.JSONDecodeError:
+        # e.g. an HTML error page from a proxy
+        return response.status, {"message": response.reason}
+
+
+def close_github_connections():
+    """Close the kept-alive GitHub connections of all threads."""
+    with _github_lock:
+        connections = list(_github_connections.values())
+        _github_connections.clear()
+    for connection in connections:
+        connection.close()
+
+
+def github_error(status, data):
+    """Describe a failed GitHub API response for log messages."""
+    message = (data or {}).get("message")
+    return f"{status} {message}" if status else message
+
+
+def publish_release(tag_name, title, notes, release_assets, replace=False):
+    """Create a GitHub release for ``tag_name`` and upload its assets.
+
+    Like ``gh release create``, the release is created as a draft and only
+    published once every asset is uploaded, so it is never visible with
+    missing assets. The draft is deleted again if anything fails. With
+    ``replace``, an existing release for the tag is deleted just before
+    publishing, so its download URLs keep working during the upload.
+    """
+    status, release = github_request(
+        "POST", f"{github_api()}/releases",
+        {"tag_name": tag_name, "name": title, "body": notes, "draft": True}
+    )
+    if status != 201:
+        log(f"Release failed: {github_error(status, release)}", "error")
+        return False
+
+    upload_url = release["upload_url"].split("{")[0]
+
+    def upload(asset):
+        """Upload one asset, returning an error message if it fails."""
+        content_type = mimetypes.guess_type(asset.name)[0] or "application/octet-stream"
+        status, uploaded = github_request(
+            "POST", f"{upload_url}?{urllib.parse.urlencode({'name': asset.name})}",
+            asset.read_bytes(), content_type
+        )
+        if status != 201:
+            return f"Uploading {asset.name} failed: {github_error(status, uploaded)}"
+        return None
+
+    # Upload assets concurrently, each thread has its own connection
+    max_workers = max(min(len(release_assets), UPLOAD_WORKERS), 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        errors = [error for error in executor.map(upload, release_assets) if error]
+
+    # Log from this thread, so the errors land in the plugin's log block
+    for error in errors:
+        log(error, "error")
+    if errors:
+        github_request("DELETE", f"{github_api()}/releases/{release['id']}")
+        return False
+
+    # Make sure the draft is complete before touching an existing release
+    status, draft = github_request("GET", f"{github_api()}/releases/{release['id']}")
+    uploaded = {
+        asset["name"] for asset in (draft or {}).get("assets", [])
+        if asset.get("state") == "uploaded"
+    }
+    if status != 200 or uploaded != {asset.name for asset in release_assets}:
+        log(f"Release failed: draft {tag_name} is incomplete "
+            f"({github_error(status, draft) if status != 200 else 'missing assets'})",
+            "error")
+        github_request("DELETE", f"{github_api()}/releases/{release['id']}")
+        return False
+
+    if replace:
+        delete_release(tag_name)
+    status, published = github_request(
+        "PATCH", f"{github_api()}/releases/{release['id']}", {"draft": False}
+    )
+    if status != 200:
+        log(f"Release failed: {github_error(status, published)}", "error")
+        github_request("DELETE", f"{github_api()}/releases/{release['id']}")
+        if replace:
+            log(f"Release {tag_name} was deleted and is now missing, "
+                "rerun the release to restore it", "error")
+        return False
+    return True
+
+
+def delete_release(tag_name):
+    """Delete the GitHub release and tag ``tag_name``, if they exist."""
+    status, release = github_request("GET", f"{github_api()}/releases/tags/{tag_name}")
+    if status == 200:
+        github_request("DELETE", f"{github_api()}/releases/{release['id']}")
+    github_request("DELETE", f"{github_api()}/git/refs/tags/{tag_name}")
+
+
 def create_release(plugin_name, release_assets, deploy=False):
     """Create a GitHub release."""
     # Generate date-based tag
     today = datetime.date.today().isoformat()
     tag_name = f"{plugin_name}@{today}"
+    title = plugin_name.replace("-", " ").title()
 
     # Generate link to plugin README
-    readme_url = f"https://github.com/jupyter-book/myst-plugins/tree/main/plugins/{plugin_name}"
+    readme_url = f"https://github.com/{GITHUB_REPO}/tree/main/plugins/{plugin_name}"
     notes = f"See plugin documentation: {readme_url}"
 
-    # Build gh release command
-    asset_paths = [
-        str(asset.resolve().relative_to(Path.cwd()))
-        for asset in release_assets
-    ]
-    release_cmd = [
-        "gh", "release", "create", tag_name,
-        "--title", plugin_name.replace("-", " ").title(),
-        "--notes", notes
-    ] + asset_paths
-
     # Show assets
     log(f"  Assets: {', '.join([a.name for a in release_assets])}")
 
     # Stable "latest" tag in case users don't want to change their URL when new releases happen
     latest_tag = f"{plugin_name}-latest"
-    latest_cmd = [
-        "gh", "release", "create", latest_tag,
-        "--title", f"{plugin_name.replace('-', ' ').title()} (latest)",
-        "--notes", notes
-    ] + asset_paths
 
     if deploy:
-        log("  Creating release...")
+        if not github_token():
+            log("Release failed: set GH_TOKEN or log in with `gh auth login`", "error")
+            return False
+
+        log(f"  Creating release in {github_repo()}...")
         try:
-            subprocess.run(
-                release_cmd,
-                check=True,
-                capture_output=True,
-                text=True
-            )
+            if not publish_release(tag_name, title, notes, release_assets):
+                return False
             log(f"Release {tag_name} created!", "success")
 
-            # Update the stable "latest" release (delete old one first if it exists)
-            subprocess.run(
-                ["gh", "release", "delete", latest_tag, "--yes", "--cleanup-tag"],
-                capture_output=True
-            )
-            subprocess.run(
-                latest_cmd,
-                check=True,
-                capture_output=True,
-                text=True
-            )
+            # Update the stable "latest" release, replacing the old one if it exists
+            if not publish_release(latest_tag, f"{title} (latest)", notes,
+                                   release_assets, replace=True):
+                return False
             log(f"Release {latest_tag} updated!", "success")
 
             return True
-        except subprocess.CalledProcessError as e:
-            log(f"Release failed: {e.stderr}", "error")
-            return False
+        finally:
+            # The next plugin's build leaves connections idle, start it fresh
+            close_github_connections()
     else:
-        title = plugin_name.replace("-", " ").title()
-        log(f'  Command: gh release create {tag_name} --title "{title}" --notes "{notes}" {asset_paths[0]}')
+        cwd = Path.cwd()
+        asset_paths = [os.path.relpath(asset, cwd) for asset in release_assets]
+        log(f'  Would create: {tag_name} "{title}" with {", ".join(asset_paths)}')
+        log(f'  Notes: {notes}')
         log(f'  Also updates: {latest_tag} (stable download URL)')
         log("  (dry-run mode, use --deploy to execute)")
         return True
 
 
-def process_plugin(plugin_name, plugins_dir, deploy=False):
-    """Process a single plugin for release."""
+def process_plugin(plugin_name, plugins_dir, deploy=False, changes=None):
+    """Process a single plugin for release.
+
+    ``changes`` is the result of ``load_change_map``; it is computed for this
+    plugin alone if not given.
+    """
     log(f"\n{plugin_name}:")
 
     plugin_dir = plugins_dir / plugin_name
@@ -276,7 +637,9 @@ def process_plugin(plugin_name, plugins_dir, deploy=False):
         return False
 
     # Check if edited since last release
-    has_changes, message = check_changes_since_release(plugin_name, plugin_dir)
+    if changes is None:
+        changes = load_change_map([plugin_name], plugins_dir)
+    has_changes, message = changes[plugin_name]
     if not has_changes:
         log(f"  {message}, skipping")
         return True
@@ -318,12 +681,16 @@ def main(args=None):
     all_plugins = "--all" in args
     plugin_names = [arg for arg in args if not arg.startswith("--")]
 
-    # Get list of all plugins
-    all_plugin_dirs = sorted([p for p in plugins_dir.iterdir() if p.is_dir()])
+    # Get list of all plugins (scandir's is_dir() needs no extra stat call)
+    with os.scandir(plugins_dir) as entries:
+        all_plugin_dirs = sorted(
+            (plugins_dir / entry.name for entry in entries if entry.is_dir()),
+            key=lambda p: p.name
+        )
 
     # No arguments: list available plugins
     if not plugin_names and not all_plugins:
-        list_plugins(plugins_dir)
+        list_plugins(all_plugin_dirs)
         return 0
 
     # Determine which plugins to process
@@ -332,11 +699,29 @@ def main(args=None):
     else:
         targets = plugin_names
 
-    # Process each plugin
-    success_count = 0
-    for plugin_name in targets:
-        if process_plugin(plugin_name, plugins_dir, deploy):
-            success_count += 1
+    # Check all targets for changes since their last release up-front, and
+    # only process the ones that changed
+    changes = load_change_map(targets, plugins_dir)
+    unchanged = [name for name in targets if not changes[name][0]]
+    changed = [name for name in targets if changes[name][0]]
+    if unchanged:
+        log(f"\nNo changes since last release, skipping: {', '.join(unchanged)}")
+
+    # Process plugins in parallel, since most of the time is spent waiting on
+    # npm and node. Deploys stay serial because they create remote releases.
+    max_workers = max(1 if deploy else min(len(changed), os.cpu_count() or 1), 1)
+
+    def process(plugin_name):
+        # In parallel runs, print each plugin's output as one block
+        with log_block() if max_workers > 1 else contextlib.nullcontext():
+            return process_plugin(plugin_name, plugins_dir, deploy, changes)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(process, changed))
+    finally:
+        close_github_connections()
+    success_count = len(unchanged) + sum(results)
 
     log(f"\nProcessed {success_count}/{len(targets)} plugin(s)")
 